@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import logging
 import threading
 import time
-from datetime import date
+from collections import deque
+from datetime import date, datetime, timedelta
 from typing import Callable, Optional
 
 from domain.entities.network_usage import DailyUsage, SpeedSnapshot
@@ -14,6 +16,21 @@ from infrastructure.system.network_provider import NetworkProvider
 # How often (in seconds) to flush accumulated data to the database
 _FLUSH_INTERVAL = 10
 
+# How often (in seconds) to commit flushed data to disk
+_COMMIT_INTERVAL = 300
+
+# Minimum seconds between logged errors, so a persistent fault logs once a
+# minute instead of every tick
+_ERROR_LOG_INTERVAL = 60
+
+_log = logging.getLogger(__name__)
+
+
+def _next_midnight(day: date) -> float:
+    """Return the local-time epoch timestamp at which *day* ends."""
+    next_day = day + timedelta(days=1)
+    return datetime.combine(next_day, datetime.min.time()).timestamp()
+
 
 class SpeedMonitorService:
     """Coordinates network polling, in-memory accumulation, and periodic DB flush."""
@@ -25,19 +42,30 @@ class SpeedMonitorService:
     ) -> None:
         self._net = network
         self._repo = repo
-        self._subscribers: list[Callable[[SpeedSnapshot], None]] = []
-
-        self._running = False
+        # Copy-on-write: (un)subscribe swaps in a new tuple, so the monitor
+        # thread iterates a stable snapshot without locking
+        self._subscribers: tuple[Callable[[SpeedSnapshot], None], ...] = ()
+        # Most recent snapshot, for consumers that poll instead of subscribing;
+        # a one-slot deque: append and read are atomic, so no lock is needed
+        self._latest: deque[SpeedSnapshot] = deque(maxlen=1)
+
+        self._stop_event = threading.Event()
+        self._last_error_ts: float = float("-inf")
         self._thread: Optional[threading.Thread] = None
 
         # In-memory accumulators (flushed periodically)
         self._today: date = date.today()
+        self._today_iso: str = self._today.isoformat()
+        self._next_rollover_ts: float = _next_midnight(self._today)
         self._bytes_sent: int = 0
         self._bytes_recv: int = 0
         self._max_up: int = 0
         self._max_down: int = 0
         self._active_secs: int = 0
-        self._flush_counter: int = 0
+        # Ticks (one per snapshot) and the ticks at which to flush / commit
+        self._tick: int = 0
+        self._next_flush_tick: int = _FLUSH_INTERVAL
+        self._next_commit_tick: int = _COMMIT_INTERVAL
 
         # Load existing today data from DB if present
         existing = self._repo.get_daily(self._today)
@@ -51,21 +79,33 @@ class SpeedMonitorService:
     # ── public API ───────────────────────────────────────────────────────────
 
     def start(self) -> None:
-        self._running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._loop, daemon=True)
         self._thread.start()
 
     def stop(self) -> None:
-        self._running = False
+        self._stop_event.set()  # wakes the loop out of its wait immediately
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=2)
         self.flush()  # final flush
+        self._commit()
 
     def subscribe(self, callback: Callable[[SpeedSnapshot], None]) -> None:
         if callback not in self._subscribers:
-            self._subscribers.append(callback)
+            self._subscribers = (*self._subscribers, callback)
 
     def unsubscribe(self, callback: Callable[[SpeedSnapshot], None]) -> None:
         if callback in self._subscribers:
-            self._subscribers.remove(callback)
+            self._subscribers = tuple(
+                cb for cb in self._subscribers if cb != callback)
+
+    @property
+    def latest_snapshot(self) -> Optional[SpeedSnapshot]:
+        """The most recent speed sample, or None before the first one."""
+        try:
+            return self._latest[-1]
+        except IndexError:
+            return None
 
     @property
     def today_usage(self) -> DailyUsage:
@@ -81,44 +121,103 @@ class SpeedMonitorService:
     # ── internals ────────────────────────────────────────────────────────────
 
     def _loop(self) -> None:
-        while self._running:
+        # Sleep to a monotonic deadline so work time doesn't stretch the period
+        deadline = time.monotonic()
+        while not self._stop_event.is_set():
+            try:
+                self._tick_once()
+            except Exception:
+                # Last resort: a bug in accumulation or rollover is logged
+                # and the next tick runs, instead of the thread dying silently
+                self._log_error("Monitor tick failed")
+            deadline += 1.0
+            sleep_for = deadline - time.monotonic()
+            if sleep_for > 0:
+                self._stop_event.wait(sleep_for)
+            else:
+                # Fell behind (e.g. resumed from suspend) — don't try to catch up
+                deadline = time.monotonic()
+
+    def _tick_once(self) -> None:
+        try:
+            snap = self._net.snapshot()
+        except OSError:
+            self._log_error("Reading network counters failed")
+            return
+        self._accumulate(snap)
+        self._latest.append(snap)
+        for cb in self._subscribers:
+            # Isolated per subscriber: a broken UI callback must not
+            # skip the others or the accumulation above
             try:
-                snap = self._net.snapshot()
-                self._accumulate(snap)
-                for cb in self._subscribers:
-                    try:
-                        cb(snap)
-                    except Exception:
-                        pass
+                cb(snap)
             except Exception:
-                pass
-            time.sleep(1)
+                self._log_error("Speed subscriber raised")
 
     def _accumulate(self, snap: SpeedSnapshot) -> None:
-        now = date.today()
-        if now != self._today:
-            # Day rolled over — flush yesterday and reset
-            self.flush()
-            self._today = now
-            self._bytes_sent = 0
-            self._bytes_recv = 0
-            self._max_up = 0
-            self._max_down = 0
-            self._active_secs = 0
+        # Cheap float compare; only resolve the calendar date past midnight
+        if time.time() >= self._next_rollover_ts:
+            self._rollover()
 
         self._bytes_sent += snap.bytes_sent_delta
         self._bytes_recv += snap.bytes_recv_delta
-        self._max_up = max(self._max_up, snap.up_speed)
-        self._max_down = max(self._max_down, snap.down_speed)
+        up = snap.up_speed
+        if up > self._max_up:
+            self._max_up = up
+        down = snap.down_speed
+        if down > self._max_down:
+            self._max_down = down
         self._active_secs += 1
 
-        self._flush_counter += 1
-        if self._flush_counter >= _FLUSH_INTERVAL:
+        tick = self._tick + 1
+        self._tick = tick
+        if tick >= self._next_flush_tick:
             self.flush()
-            self._flush_counter = 0
+            self._next_flush_tick = tick + _FLUSH_INTERVAL
+        if tick >= self._next_commit_tick:
+            self._commit()
+
+    def _rollover(self) -> None:
+        now = date.today()
+        self._next_rollover_ts = _next_midnight(now)
+        if now == self._today:
+            return
+        # Day rolled over — write yesterday's final totals and today's
+        # fresh row as one batch, commit, then reset
+        today_iso = now.isoformat()
+        self._repo.upsert_many([
+            (self._today_iso, self._bytes_sent, self._bytes_recv,
+             self._max_up, self._max_down, self._active_secs),
+            (today_iso, 0, 0, 0, 0, 0),
+        ])
+        self._commit()
+        self._today = now
+        self._today_iso = today_iso
+        self._bytes_sent = 0
+        self._bytes_recv = 0
+        self._max_up = 0
+        self._max_down = 0
+        self._active_secs = 0
 
     def flush(self) -> None:
-        try:
-            self._repo.upsert_daily(self.today_usage)
-        except Exception:
-            pass
+        # Hot path: pass primitives, skipping the DailyUsage round-trip.
+        # Writes are queued; storage errors surface (and are logged) on the
+        # repository's writer thread, not here
+        self._repo.upsert_daily_raw(
+            self._today_iso,
+            self._bytes_sent,
+            self._bytes_recv,
+            self._max_up,
+            self._max_down,
+            self._active_secs,
+        )
+
+    def _commit(self) -> None:
+        self._next_commit_tick = self._tick + _COMMIT_INTERVAL
+        self._repo.flush()
+
+    def _log_error(self, msg: str) -> None:
+        now = time.monotonic()
+        if now - self._last_error_ts >= _ERROR_LOG_INTERVAL:
+            self._last_error_ts = now
+            _log.warning(msg, exc_info=True)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
+from typing import Optional
 
 
 @dataclass
@@ -64,6 +65,14 @@ class MonthlyUsage:
         return self.bytes_recv / self.active_seconds if self.active_seconds else 0.0
 
 
+@dataclass
+class UsageOverview:
+    """A day's usage together with its calendar month, read in one go."""
+
+    daily: Optional[DailyUsage]  # None if nothing was recorded that day
+    monthly: MonthlyUsage
+
+
 @dataclass
 class SpeedSnapshot:
     """A single point-in-time speed reading (not persisted, used in-memory)."""
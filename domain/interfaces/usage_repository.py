@@ -1,29 +1,54 @@
-"""Abstract interface for usage data persistence — Domain layer."""
+"""Structural interface for usage data persistence — Domain layer."""
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Protocol, Sequence, Tuple
 
-from domain.entities.network_usage import DailyUsage, MonthlyUsage
+from domain.entities.network_usage import (DailyUsage, MonthlyUsage,
+                                           UsageOverview)
 
 
-class UsageRepository(ABC):
-    """Contract that any storage backend must implement."""
+class UsageRepository(Protocol):
+    """Contract that any storage backend must satisfy (no inheritance needed)."""
 
-    @abstractmethod
     def upsert_daily(self, usage: DailyUsage) -> None:
         """Insert or update a single day's usage record."""
 
-    @abstractmethod
+    def upsert_daily_raw(
+        self,
+        day_iso: str,
+        bytes_sent: int,
+        bytes_recv: int,
+        max_up_speed: int,
+        max_down_speed: int,
+        active_seconds: int,
+    ) -> None:
+        """Same as upsert_daily, from primitives (day as an ISO date string)."""
+
+    def upsert_many(
+        self, rows: Sequence[Tuple[str, int, int, int, int, int]]
+    ) -> None:
+        """Upsert several upsert_daily_raw-shaped rows as one batch."""
+
+    def flush(self) -> None:
+        """Make previously upserted records durable."""
+
     def get_daily(self, day: date) -> Optional[DailyUsage]:
         """Retrieve usage for a specific day, or None."""
 
-    @abstractmethod
     def get_range(self, start: date, end: date) -> List[DailyUsage]:
         """Retrieve all daily records within [start, end] inclusive."""
 
-    @abstractmethod
+    def get_range_rows(
+        self, start: date, end: date
+    ) -> List[Tuple[str, int, int, int, int, int]]:
+        """Like get_range, but as raw (day_iso, bytes_sent, bytes_recv,
+        max_up_speed, max_down_speed, active_seconds) tuples — no entity or
+        date parsing, for bulk consumers such as CSV export."""
+
     def get_monthly(self, year: int, month: int) -> MonthlyUsage:
         """Aggregate usage for a given calendar month."""
+
+    def get_overview(self, day: date) -> UsageOverview:
+        """Usage for *day* and its calendar month in a single read."""
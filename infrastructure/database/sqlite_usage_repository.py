@@ -2,16 +2,32 @@
 
 from __future__ import annotations
 
+import logging
+import queue
 import sqlite3
+import threading
 from datetime import date
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
-from domain.entities.network_usage import DailyUsage, MonthlyUsage
-from domain.interfaces.usage_repository import UsageRepository
+from domain.entities.network_usage import (DailyUsage, MonthlyUsage,
+                                           UsageOverview)
 
 _DB_NAME = "usage_history.db"
 
+_log = logging.getLogger(__name__)
+
+# Pending writes before new ones are dropped — each upsert carries the full
+# day totals, so a dropped write is superseded by the next one
+_QUEUE_SIZE = 64
+
+# Seconds to wait for queue room when a write must not be dropped
+_PUT_TIMEOUT = 5.0
+
+# Writer-queue control markers
+_COMMIT = object()
+_STOP = object()
+
 _CREATE_TABLE = """
 CREATE TABLE IF NOT EXISTS daily_usage (
     day           TEXT PRIMARY KEY,
@@ -24,77 +40,215 @@ CREATE TABLE IF NOT EXISTS daily_usage (
 """
 
 
-class SqliteUsageRepository(UsageRepository):
-    """Persists daily network usage to a local SQLite file."""
+class SqliteUsageRepository:
+    """Persists daily network usage to a local SQLite file.
+
+    Writes are handed to a single writer thread so a slow disk never stalls
+    the caller; reads first wait for queued writes to land.
+    """
+
+    # Explicit column order — matches the positional reads in _row_to_entity
+    _COLUMNS = ("day, bytes_sent, bytes_recv, "
+                "max_up_speed, max_down_speed, active_seconds")
+
+    _UPSERT_SQL = """
+        INSERT INTO daily_usage (day, bytes_sent, bytes_recv,
+                                 max_up_speed, max_down_speed, active_seconds)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(day) DO UPDATE SET
+            bytes_sent     = excluded.bytes_sent,
+            bytes_recv     = excluded.bytes_recv,
+            max_up_speed   = MAX(daily_usage.max_up_speed, excluded.max_up_speed),
+            max_down_speed = MAX(daily_usage.max_down_speed, excluded.max_down_speed),
+            active_seconds = excluded.active_seconds
+        """
+
+    _SELECT_DAY_SQL = f"SELECT {_COLUMNS} FROM daily_usage WHERE day = ?"
+
+    _SELECT_RANGE_SQL = (
+        f"SELECT {_COLUMNS} FROM daily_usage "
+        "WHERE day BETWEEN ? AND ? ORDER BY day"
+    )
+
+    # Half-open [start, end) range so SQLite can range-scan the `day` PK
+    _AGGREGATE_SQL = """
+        SELECT COALESCE(SUM(bytes_sent), 0),
+               COALESCE(SUM(bytes_recv), 0),
+               COALESCE(MAX(max_up_speed), 0),
+               COALESCE(MAX(max_down_speed), 0),
+               COALESCE(SUM(active_seconds), 0),
+               COUNT(*)
+        FROM daily_usage
+        WHERE day >= ? AND day < ?
+        """
 
     def __init__(self, db_dir: Path | None = None) -> None:
         db_path = (db_dir or Path.cwd()) / _DB_NAME
         self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
         self._conn.execute("PRAGMA journal_mode=WAL;")
+        # NORMAL in WAL mode skips the fsync per commit; an OS crash can lose
+        # the last commit window, which is acceptable for usage statistics.
+        self._conn.execute("PRAGMA synchronous=NORMAL;")
+        self._conn.execute("PRAGMA temp_store=MEMORY;")
+        self._conn.execute("PRAGMA cache_size=-2000;")  # ~2 MB page cache
+        try:
+            self._conn.execute("PRAGMA mmap_size=67108864;")  # 64 MB
+        except sqlite3.Error:
+            pass  # mmap unsupported on this build — plain reads still work
         self._conn.execute(_CREATE_TABLE)
         self._conn.commit()
 
+        self._closed = False
+        self._lock = threading.Lock()
+        self._q: queue.Queue[object] = queue.Queue(maxsize=_QUEUE_SIZE)
+        self._writer = threading.Thread(target=self._drain, daemon=True)
+        self._writer.start()
+
     # --- writes ---
 
     def upsert_daily(self, usage: DailyUsage) -> None:
-        self._conn.execute(
-            """
-            INSERT INTO daily_usage (day, bytes_sent, bytes_recv,
-                                     max_up_speed, max_down_speed, active_seconds)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(day) DO UPDATE SET
-                bytes_sent     = excluded.bytes_sent,
-                bytes_recv     = excluded.bytes_recv,
-                max_up_speed   = MAX(daily_usage.max_up_speed, excluded.max_up_speed),
-                max_down_speed = MAX(daily_usage.max_down_speed, excluded.max_down_speed),
-                active_seconds = excluded.active_seconds
-            """,
-            (
-                usage.day.isoformat(),
-                usage.bytes_sent,
-                usage.bytes_recv,
-                usage.max_up_speed,
-                usage.max_down_speed,
-                usage.active_seconds,
-            ),
+        self.upsert_daily_raw(
+            usage.day.isoformat(),
+            usage.bytes_sent,
+            usage.bytes_recv,
+            usage.max_up_speed,
+            usage.max_down_speed,
+            usage.active_seconds,
         )
-        self._conn.commit()
+
+    def upsert_daily_raw(
+        self,
+        day_iso: str,
+        bytes_sent: int,
+        bytes_recv: int,
+        max_up_speed: int,
+        max_down_speed: int,
+        active_seconds: int,
+    ) -> None:
+        self._enqueue([(day_iso, bytes_sent, bytes_recv,
+                        max_up_speed, max_down_speed, active_seconds)])
+
+    def upsert_many(
+        self, rows: Sequence[Tuple[str, int, int, int, int, int]]
+    ) -> None:
+        # Batches carry rows no later upsert replaces (e.g. a finished day),
+        # so wait for room instead of dropping them
+        self._enqueue(list(rows), block=True)
+
+    def flush(self) -> None:
+        """Commit pending writes — upserts stay in the open transaction until then."""
+        self._enqueue(_COMMIT)
+
+    def _enqueue(self, item: object, block: bool = False) -> None:
+        if self._closed:
+            return
+        try:
+            self._q.put(item, block=block, timeout=_PUT_TIMEOUT if block else None)
+        except queue.Full:
+            # A plain upsert is superseded by the next one; a commit marker or
+            # a blocking batch (e.g. a finished day) is not, so say it's lost
+            if block or item is _COMMIT:
+                _log.warning("SQLite writer stalled; dropped %s",
+                             "commit" if item is _COMMIT else "batch write")
+
+    def _drain(self) -> None:
+        """Writer thread: apply queued upsert batches and commits in order."""
+        while True:
+            item = self._q.get()
+            try:
+                if item is _STOP:
+                    return
+                with self._lock:
+                    if item is _COMMIT:
+                        self._conn.commit()
+                    else:
+                        self._conn.executemany(self._UPSERT_SQL, item)
+            except sqlite3.Error:
+                _log.warning("SQLite write failed", exc_info=True)
+            except Exception:
+                # Readers join() this queue: the writer must outlive any
+                # bad item, or every later get_* would block forever
+                _log.exception("Unexpected error in SQLite writer")
+            finally:
+                self._q.task_done()
 
     # --- reads ---
 
     def get_daily(self, day: date) -> Optional[DailyUsage]:
-        row = self._conn.execute(
-            "SELECT * FROM daily_usage WHERE day = ?", (day.isoformat(),)
-        ).fetchone()
+        self._q.join()
+        with self._lock:
+            row = self._conn.execute(
+                self._SELECT_DAY_SQL, (day.isoformat(),)
+            ).fetchone()
         return self._row_to_entity(row) if row else None
 
     def get_range(self, start: date, end: date) -> List[DailyUsage]:
-        rows = self._conn.execute(
-            "SELECT * FROM daily_usage WHERE day BETWEEN ? AND ? ORDER BY day",
-            (start.isoformat(), end.isoformat()),
-        ).fetchall()
+        self._q.join()
+        with self._lock:
+            rows = self._conn.execute(
+                self._SELECT_RANGE_SQL,
+                (start.isoformat(), end.isoformat()),
+            ).fetchall()
         return [self._row_to_entity(r) for r in rows]
 
+    def get_range_rows(
+        self, start: date, end: date
+    ) -> List[Tuple[str, int, int, int, int, int]]:
+        self._q.join()
+        with self._lock:
+            return self._conn.execute(
+                self._SELECT_RANGE_SQL,
+                (start.isoformat(), end.isoformat()),
+            ).fetchall()
+
     def get_monthly(self, year: int, month: int) -> MonthlyUsage:
-        prefix = f"{year:04d}-{month:02d}"
-        rows = self._conn.execute(
-            "SELECT * FROM daily_usage WHERE day LIKE ?", (f"{prefix}%",)
-        ).fetchall()
-        mu = MonthlyUsage(year=year, month=month)
-        for r in rows:
-            d = self._row_to_entity(r)
-            mu.bytes_sent += d.bytes_sent
-            mu.bytes_recv += d.bytes_recv
-            mu.max_up_speed = max(mu.max_up_speed, d.max_up_speed)
-            mu.max_down_speed = max(mu.max_down_speed, d.max_down_speed)
-            mu.active_seconds += d.active_seconds
-            mu.days_tracked += 1
-        return mu
+        self._q.join()
+        with self._lock:
+            return self._monthly_locked(year, month)
+
+    def get_overview(self, day: date) -> UsageOverview:
+        # One queue drain and one lock hold for both reads, instead of a
+        # get_daily + get_monthly pair each doing their own
+        self._q.join()
+        with self._lock:
+            row = self._conn.execute(
+                self._SELECT_DAY_SQL, (day.isoformat(),)
+            ).fetchone()
+            monthly = self._monthly_locked(day.year, day.month)
+        return UsageOverview(
+            daily=self._row_to_entity(row) if row else None,
+            monthly=monthly,
+        )
+
+    def _monthly_locked(self, year: int, month: int) -> MonthlyUsage:
+        """get_monthly body; the caller holds self._lock after a queue join."""
+        start, end = self._month_bounds(year, month)
+        sent, recv, max_up, max_down, active, days = self._conn.execute(
+            self._AGGREGATE_SQL, (start, end)
+        ).fetchone()
+        return MonthlyUsage(
+            year=year,
+            month=month,
+            bytes_sent=sent,
+            bytes_recv=recv,
+            max_up_speed=max_up,
+            max_down_speed=max_down,
+            active_seconds=active,
+            days_tracked=days,
+        )
 
     # --- helpers ---
 
+    @staticmethod
+    def _month_bounds(year: int, month: int) -> tuple[str, str]:
+        """Return ISO bounds of the half-open range [1st of month, 1st of next)."""
+        start = date(year, month, 1)
+        end = date(year + (month == 12), month % 12 + 1, 1)
+        return start.isoformat(), end.isoformat()
+
     @staticmethod
     def _row_to_entity(row: tuple) -> DailyUsage:
+        """Build an entity from a row selected in `_COLUMNS` order."""
         return DailyUsage(
             day=date.fromisoformat(row[0]),
             bytes_sent=row[1],
@@ -105,4 +259,23 @@ class SqliteUsageRepository(UsageRepository):
         )
 
     def close(self) -> None:
-        self._conn.close()
+        """Drain pending writes, commit, and close the connection."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._q.put(_STOP, timeout=_PUT_TIMEOUT)
+        except queue.Full:
+            # Writer is stuck: don't hang the atexit handler on it
+            _log.warning("SQLite writer stalled; closing without draining")
+        self._writer.join(timeout=_PUT_TIMEOUT)
+        # A writer still mid-statement holds the lock; leave the connection
+        # to process exit rather than wait on it
+        if not self._lock.acquire(timeout=_PUT_TIMEOUT):
+            _log.warning("SQLite writer busy; connection left open at exit")
+            return
+        try:
+            self._conn.commit()
+            self._conn.close()
+        finally:
+            self._lock.release()
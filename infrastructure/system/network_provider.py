@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import time
+
 import psutil
 
 from domain.entities.network_usage import SpeedSnapshot
@@ -11,20 +13,42 @@ class NetworkProvider:
     """Reads raw network byte counters from the OS."""
 
     def __init__(self) -> None:
-        counters = psutil.net_io_counters()
-        self._last_sent: int = counters.bytes_sent
-        self._last_recv: int = counters.bytes_recv
+        self._last_sent, self._last_recv = self._read()
+        self._last_ts: float = time.perf_counter()
 
     def snapshot(self) -> SpeedSnapshot:
-        """Return the delta since the last call (call once per second)."""
-        counters = psutil.net_io_counters()
-        sent_delta = counters.bytes_sent - self._last_sent
-        recv_delta = counters.bytes_recv - self._last_recv
-        self._last_sent = counters.bytes_sent
-        self._last_recv = counters.bytes_recv
+        """Return the delta since the last call (meant to be called once per second).
+
+        Speeds are normalised by the real elapsed time, so they stay correct
+        even if the caller's loop slips. Raises OSError if the counters
+        cannot be read.
+        """
+        sent, recv = self._read()
+        # perf_counter, not monotonic: on Windows monotonic() ticks in
+        # ~15.6 ms steps, a ~1.5% error on a one-second interval
+        now = time.perf_counter()
+        sent_delta = max(sent - self._last_sent, 0)
+        recv_delta = max(recv - self._last_recv, 0)
+        dt = now - self._last_ts
+        self._last_sent = sent
+        self._last_recv = recv
+        self._last_ts = now
+        if dt <= 0:
+            dt = 1.0
         return SpeedSnapshot(
-            up_speed=max(sent_delta, 0),
-            down_speed=max(recv_delta, 0),
-            bytes_sent_delta=max(sent_delta, 0),
-            bytes_recv_delta=max(recv_delta, 0),
+            up_speed=int(sent_delta / dt),
+            down_speed=int(recv_delta / dt),
+            bytes_sent_delta=sent_delta,
+            bytes_recv_delta=recv_delta,
         )
+
+    @staticmethod
+    def _read() -> tuple[int, int]:
+        # System totals only: no per-NIC dict is built. psutil returns an
+        # snetio tuple: index 0 = bytes_sent, 1 = bytes_recv
+        try:
+            counters = psutil.net_io_counters()
+        except psutil.Error as e:
+            # Callers only need to know OSError, not psutil's hierarchy
+            raise OSError(f"Reading network counters failed: {e}") from e
+        return counters[0], counters[1]
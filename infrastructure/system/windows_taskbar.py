@@ -6,6 +6,7 @@ import ctypes
 import ctypes.wintypes as wintypes
 
 user32 = ctypes.windll.user32
+shell32 = ctypes.windll.shell32
 
 # ── Win32 constants ──────────────────────────────────────────────────────────
 
@@ -23,6 +24,20 @@ HWND_TOPMOST = wintypes.HWND(-1)
 SWP_NOSIZE = 0x0001
 SWP_NOMOVE = 0x0002
 SWP_NOACTIVATE = 0x0010
+GW_HWNDPREV = 3
+
+# QUERY_USER_NOTIFICATION_STATE values that mean a fullscreen app is up
+QUNS_BUSY = 2
+QUNS_RUNNING_D3D_FULL_SCREEN = 3
+QUNS_PRESENTATION_MODE = 4
+_FULLSCREEN_STATES = (QUNS_BUSY, QUNS_RUNNING_D3D_FULL_SCREEN,
+                      QUNS_PRESENTATION_MODE)
+EVENT_SYSTEM_FOREGROUND = 0x0003
+WINEVENT_OUTOFCONTEXT = 0x0000
+
+WINEVENTPROC = ctypes.WINFUNCTYPE(
+    None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+    wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
 
 # ── Type annotations for Win32 functions ─────────────────────────────────────
 
@@ -45,10 +60,17 @@ for fn, argt, rest in [
      wintypes.HWND, wintypes.DWORD, wintypes.BYTE, wintypes.DWORD], wintypes.BOOL),
     (user32.GetParent, [wintypes.HWND], wintypes.HWND),
     (user32.GetForegroundWindow, [], wintypes.HWND),
+    (user32.GetWindow, [wintypes.HWND, wintypes.UINT], wintypes.HWND),
+    (user32.SetWinEventHook, [wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE,
+     WINEVENTPROC, wintypes.DWORD, wintypes.DWORD, wintypes.DWORD], wintypes.HANDLE),
+    (user32.UnhookWinEvent, [wintypes.HANDLE], wintypes.BOOL),
 ]:
     fn.argtypes = argt
     fn.restype = rest
 
+shell32.SHQueryUserNotificationState.argtypes = [ctypes.POINTER(ctypes.c_int)]
+shell32.SHQueryUserNotificationState.restype = ctypes.c_long  # HRESULT
+
 
 def get_rect(hwnd: int) -> tuple[int, int, int, int]:
     """Return (left, top, right, bottom) for a window handle."""
@@ -66,6 +88,8 @@ class TaskbarHelper:
         self.h_start: int = 0
         self.h_progman: int = 0
         self.h_workerw: int = 0
+        self._fg_hook = None
+        self._fg_proc = None  # must outlive the hook, or ctypes frees the thunk
         self._find()
 
     def _find(self) -> None:
@@ -141,15 +165,59 @@ class TaskbarHelper:
         """Force the window to the top of the Z-order if relevant windows have focus."""
         fg = user32.GetForegroundWindow()
         # include desktop windows in the check
-        if fg in (self.h_taskbar, self.h_progman, self.h_workerw):
-            user32.SetWindowPos(hwnd, HWND_TOPMOST, 0, 0, 0, 0,
-                                SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE)
+        if fg not in (self.h_taskbar, self.h_progman, self.h_workerw):
+            return
+        # Nothing above us in the Z-order — skip the SetWindowPos round-trip
+        # (and the WM_WINDOWPOSCHANGING it sends)
+        if not user32.GetWindow(hwnd, GW_HWNDPREV):
+            return
+        user32.SetWindowPos(hwnd, HWND_TOPMOST, 0, 0, 0, 0,
+                            SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE)
+
+    def register_foreground_hook(self, callback) -> bool:
+        """Call *callback()* whenever the foreground window changes.
+
+        The hook is out-of-context, so events are delivered on the calling
+        thread's message loop — register from the Tk thread (Tk pumps Win32
+        messages) and the callback runs there too. Returns False on failure.
+        """
+        if self._fg_hook:
+            return True
+        self._fg_proc = WINEVENTPROC(lambda *_: callback())
+        self._fg_hook = user32.SetWinEventHook(
+            EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND, None,
+            self._fg_proc, 0, 0, WINEVENT_OUTOFCONTEXT)
+        if not self._fg_hook:
+            self._fg_proc = None
+            return False
+        return True
+
+    def unregister_foreground_hook(self) -> None:
+        if self._fg_hook:
+            user32.UnhookWinEvent(self._fg_hook)
+            self._fg_hook = None
+            self._fg_proc = None
 
     def hide(self, hwnd: int) -> None:
         user32.ShowWindow(hwnd, 0)  # SW_HIDE
 
     def is_fullscreen_active(self) -> bool:
-        """Check if the foreground window is fullscreen (taskbar hidden)."""
+        """Check if the foreground window is fullscreen on the primary screen.
+
+        SHQueryUserNotificationState is a cheap first filter: when the shell
+        reports no fullscreen/busy state the window-rect check is skipped.
+        Its states are system-wide (they also cover a secondary monitor or
+        presentation settings), so a positive answer is confirmed against
+        the primary screen, where the widget lives.
+        """
+        state = ctypes.c_int()
+        if (shell32.SHQueryUserNotificationState(ctypes.byref(state)) == 0
+                and state.value not in _FULLSCREEN_STATES):
+            return False
+        return self._foreground_covers_screen()
+
+    def _foreground_covers_screen(self) -> bool:
+        """Fallback check: the foreground window covers the primary screen."""
         fg = user32.GetForegroundWindow()
         if not fg or fg == self.h_taskbar or fg == self.h_progman or fg == self.h_workerw:
             return False
@@ -5,6 +5,7 @@ Bootstraps the layered architecture:
   Infrastructure → Application → Presentation
 """
 
+import atexit
 import sys
 import ctypes
 from pathlib import Path
@@ -14,24 +15,33 @@ _ROOT = Path(__file__).resolve().parent
 if str(_ROOT) not in sys.path:
     sys.path.insert(0, str(_ROOT))
 
-from application.services.speed_monitor_service import SpeedMonitorService  # noqa: E402
-from infrastructure.database.sqlite_usage_repository import \
-    SqliteUsageRepository  # noqa: E402
-from infrastructure.system.network_provider import NetworkProvider  # noqa: E402
-from presentation.widgets.taskbar_widget import TaskbarWidget  # noqa: E402
+_MUTEX_NAME = "SpeedMonitorMutex"
+_ERROR_ALREADY_EXISTS = 183
+
+if sys.platform == "win32":
+    # Resolved once with explicit prototypes; use_last_error captures the
+    # error code right after the call instead of a second GetLastError call.
+    _k32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _k32.CreateMutexW.argtypes = [ctypes.c_void_p, ctypes.c_bool, ctypes.c_wchar_p]
+    _k32.CreateMutexW.restype = ctypes.c_void_p
 
 
 def main() -> None:
-    # Mutex for Inno Setup (CloseApplications detection)
-    mutex_name = "SpeedMonitorMutex"
-    kernel32 = ctypes.windll.kernel32
-    mutex = kernel32.CreateMutexW(None, False, mutex_name)
-    last_error = kernel32.GetLastError()
-    
-    # 183 = ERROR_ALREADY_EXISTS
-    if last_error == 183:
-        print("SpeedMonitor is already running.")
-        sys.exit(0)
+    if sys.platform == "win32":
+        # Mutex for Inno Setup (CloseApplications detection); the handle is
+        # held for the life of the process
+        mutex = _k32.CreateMutexW(None, False, _MUTEX_NAME)  # noqa: F841
+        if ctypes.get_last_error() == _ERROR_ALREADY_EXISTS:
+            print("SpeedMonitor is already running.")
+            sys.exit(0)
+
+    # Heavy imports (Tk, PIL, pystray, sqlite3) only once we know we're the
+    # sole instance — a second launch exits without paying for them
+    from application.services.speed_monitor_service import SpeedMonitorService
+    from infrastructure.database.sqlite_usage_repository import \
+        SqliteUsageRepository
+    from infrastructure.system.network_provider import NetworkProvider
+    from presentation.widgets.taskbar_widget import TaskbarWidget
 
     print()
     print("SpeedMonitor")
@@ -41,6 +51,7 @@ def main() -> None:
 
     # 1. Infrastructure
     repo = SqliteUsageRepository(db_dir=_ROOT)
+    atexit.register(repo.close)  # runs last: drains the write queue
     network = NetworkProvider()
 
     # 2. Application
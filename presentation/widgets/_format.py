@@ -0,0 +1,37 @@
+"""Speed text formatting for the widgets — Presentation layer."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+# Unit names indexed by how many factors of 1024 the speed spans
+_UNITS = ("B/s", "KB/s", "MB/s", "GB/s")
+
+
+def unit_index(n: int) -> int:
+    """How many factors of 1024 *n* spans (0 = B … 3 = GB), capped at 3."""
+    # bit_length picks the unit directly instead of a >= ladder
+    return min(3, max(0, (n.bit_length() - 1) // 10))
+
+
+def format_speed(bps: int) -> tuple[str, str]:
+    """Format a speed as (number, unit)."""
+    i = unit_index(bps)
+    if not i:
+        return _format_bucket(0, bps)
+    # Hundredths of the unit by integer division, ties to even as f"{:.2f}"
+    # rounds them (the statistics window still formats that way): also the
+    # cache bucket, so speeds within 1% of the unit share an entry
+    shift = 10 * i
+    q, r = divmod(bps * 100, 1 << shift)
+    half = 1 << (shift - 1)
+    q += r > half or (r == half and q & 1)
+    return _format_bucket(i, q)
+
+
+@lru_cache(maxsize=4096)
+def _format_bucket(i: int, n: int) -> tuple[str, str]:
+    if not i:
+        return str(n), _UNITS[0]
+    whole, frac = divmod(n, 100)
+    return f"{whole}.{frac:02d}", _UNITS[i]
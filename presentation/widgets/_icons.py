@@ -0,0 +1,39 @@
+"""Pre-rendered widget icons — Presentation layer.
+
+Static images are embedded as base64 PNG so startup decodes bytes instead of
+rasterising shapes with ImageDraw.
+"""
+
+# 64x64 RGBA tray icon: dark rounded square, orange up / cyan down arrows
+TRAY_ICON_PNG_B64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAABgklEQVR42u2bPQ7CMAyFkydG"
+    "1q7lAJyAyzFwOU7AAcjalR2mSoBakaL4L7ZXqiSf/Z5JWiWnihjH8ZkMRikl/3om9wi+JRG5"
+    "Z/CaRMAL/BobvMCvMcIT/BIrpBdzOz9E54dk9Wd4iSTMzEjOI0tX/z2Ol72MBbT4XsIK7i0A"
+    "LdWXUgE0wUskAdrguZMQPUDzbo9DBdAKz5WEsICFgw6lCqAdnjoJYQFLZ3yKcWEFnmp8WIKn"
+    "mCd6gLXqt56P9Y3QlkVzvR0KC3hPQPb0QWQpdrUPDsNgDm6apnYJqBksekAkoOMe0CLK9V79"
+    "7Hg6hAIiAZb2AVvk3Spa2ASaFiMxX/QAjVXhnAeaF8cxPiwsknLc6AFWpEqlKljwK2VfCQto"
+    "/8ui/ldhUcC/EBz7irCA1r17l+8DaqE4D1bsFvgFx32qjB5Qc7WMSwXc1S+lZDEFfMNyw39Y"
+    "QEIF0jEzi/aAuepS1U/p6+Kklw+l74rH2g8e4Bct0HMSltji8nRVs+r4+vwLwr2aB1MVo3kA"
+    "AAAASUVORK5CYII="
+)
+
+# DU Meter style speed arrows in a 16x36 box, as (x1, y1, x2, y2) pixel
+# rectangles (x2 / y2 exclusive) — the rasterised canvas shapes, painted
+# into one PhotoImage
+ARROW_SIZE = (16, 36)
+
+# Download (top): cyan arrow pointing DOWN to a line
+DL_ARROW_RECTS = (
+    (5, 2, 11, 8),                      # stem
+    (2, 7, 14, 8), (3, 8, 13, 9), (4, 9, 12, 10),
+    (5, 10, 11, 11), (6, 11, 10, 12), (7, 12, 9, 13),  # head
+    (3, 16, 13, 17),                    # base line
+)
+
+# Upload (bottom): orange arrow pointing UP from a line
+UL_ARROW_RECTS = (
+    (3, 20, 13, 21),                    # base line
+    (7, 24, 9, 25), (6, 25, 10, 26), (5, 26, 11, 27),
+    (4, 27, 12, 28), (3, 28, 13, 29), (2, 29, 14, 30),  # head
+    (5, 29, 11, 35),                    # stem
+)
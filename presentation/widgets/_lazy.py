@@ -0,0 +1,19 @@
+"""Lazily imported presentation windows — Presentation layer.
+
+Each getter pays the import on first use and returns the cached class after
+that, keeping heavy window modules (CustomTkinter) off the startup path.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from presentation.windows.statistics_window import StatisticsWindow
+
+
+@functools.cache
+def statistics_window() -> type[StatisticsWindow]:
+    from presentation.windows.statistics_window import StatisticsWindow
+    return StatisticsWindow
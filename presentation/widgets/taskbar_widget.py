@@ -7,20 +7,32 @@ the Application layer (SpeedMonitorService).
 from __future__ import annotations
 
 import atexit
+import base64
+import io
 import signal
 import sys
 import threading
+import time
 import tkinter as tk
+import tkinter.font as tkfont
 from typing import TYPE_CHECKING
 
-import pystray
-from PIL import Image, ImageDraw
-
 from domain.entities.network_usage import SpeedSnapshot
 from infrastructure.system.windows_taskbar import TaskbarHelper
+from presentation.widgets import _icons, _lazy
+from presentation.widgets._format import format_speed
 
 if TYPE_CHECKING:
+    import pystray
+    from PIL import Image
+
     from application.services.speed_monitor_service import SpeedMonitorService
+
+# Set from the SIGINT handler; the Tk thread polls it and exits cleanly, since
+# tearing Tk down inside a signal handler can hang
+_exit_requested = threading.Event()
+
+
 class TaskbarWidget:
     """Speed monitor widget embedded in the Windows taskbar (Win11 style)."""
 
@@ -31,32 +43,53 @@ class TaskbarWidget:
     TEXT_COLOR = "#ffffff"
     UL_COLOR = "#f39c12"  # Orange
     DL_COLOR = "#00e5ff"  # Cyan
+    DRAIN_MS = 250  # how often the UI picks up the latest snapshot / Ctrl+C
+    # Re-check cadence: in-place fullscreen (F11, Alt+Enter) fires no
+    # foreground event, so this bounds how long the overlay can sit over it
+    ADJUST_MS = 1000
+    ICON_X = 3  # left edge of the arrow icons
+    TEXT_X = 25  # left edge of the number column (icons + 6 px gap)
+    NUM_MIN_W = 40  # number column width before wide values grow it
+    HWND_RETRIES = 5  # update_idletasks passes to wait for the wm frame
 
     def __init__(
         self,
         service: "SpeedMonitorService",
         repo: "UsageRepository",
+        master: tk.Misc | None = None,
     ) -> None:
         self._service = service
         self._repo = repo
 
-        self.root = tk.Tk()
+        # With a master, live in its Tcl interpreter and mainloop as a
+        # Toplevel instead of starting a second interpreter
+        self.root = tk.Tk() if master is None else tk.Toplevel(master)
+        # Bound once; the timer and label-update callbacks use these per event
+        self._after = self.root.after
+        self._tk_call = self.root.tk.call  # skips the itemconfigure wrapper
         self.root.title("SpeedMonitor")
         self.running = True
         self.embedded = False
         self._hidden = False  # fullscreen-aware visibility state
+        self._adjust_queued = False
         self._tray_icon: pystray.Icon | None = None
+        self._tray_thread: threading.Thread | None = None
+        # Last rendered speeds — unchanged values skip formatting and Tk calls
+        self._last_ul: int | None = None
+        self._last_dl: int | None = None
+        # Last (number, unit) text shown per row; only changed parts are set
+        self._ul_text = ("0", "B/s")
+        self._dl_text = ("0", "B/s")
+        # Last snapshot picked up from the service; the same object is skipped
+        self._last_snap: SpeedSnapshot | None = None
 
         self._tb = TaskbarHelper()
         self._create_ui()
 
-        # Get native HWND
-        self.root.update()
-        self.hwnd = self._get_hwnd()
-
-        # Remove title bar / borders
+        # Remove title bar / borders, then resolve the final native HWND;
+        # idle tasks are enough to map the window, no full event pass needed
         self.root.overrideredirect(True)
-        self.root.update()
+        self.root.update_idletasks()
         self.hwnd = self._get_hwnd()
 
         # Hide from alt-tab
@@ -75,22 +108,35 @@ class TaskbarWidget:
         self._tb.show(self.hwnd)
 
         atexit.register(self._cleanup)
-        signal.signal(signal.SIGINT, lambda *_: self.exit_app())
+        signal.signal(signal.SIGINT, lambda *_: _exit_requested.set())
 
-        # Wire the service callback
-        self._service.subscribe(self._on_speed)
+        # Speeds are pulled from the service's latest-snapshot slot by a
+        # Tk-side timer, so the sampler thread never waits on the UI
         self._service.start()
 
         # System tray icon
         self._setup_tray()
 
+        # React to foreground switches (entering / leaving fullscreen apps)
+        # as they happen; the periodic job is only a slow fallback
+        self._tb.register_foreground_hook(self._on_foreground_change)
         self._adjust_job()
+        self._after(self.DRAIN_MS, self._drain_pending)
         self.root.protocol("WM_DELETE_WINDOW", self.exit_app)
+        self.root.bind("<Destroy>", self._on_destroy, add="+")
 
     # ── HWND helper ──────────────────────────────────────────────────────────
 
     def _get_hwnd(self) -> int:
         frame_id = self.root.wm_frame()
+        # The wrapper frame may not exist until Tk has mapped the window;
+        # give idle processing a few short chances before falling back
+        for _ in range(self.HWND_RETRIES):
+            if frame_id and frame_id != "0x0":
+                return int(frame_id, 16)
+            time.sleep(0.001)
+            self.root.update_idletasks()
+            frame_id = self.root.wm_frame()
         if frame_id and frame_id != "0x0":
             return int(frame_id, 16)
         return self.root.winfo_id()
@@ -120,7 +166,20 @@ class TaskbarWidget:
         self.root.attributes("-transparentcolor", self.TRANS_COLOR)
         self._position()
 
+    def _on_foreground_change(self) -> None:
+        # Bursts of foreground events collapse into one adjust
+        if not self._adjust_queued:
+            self._adjust_queued = True
+            self.root.after_idle(self._adjust)
+
     def _adjust_job(self) -> None:
+        if not self.running:
+            return
+        self._adjust()
+        self._after(self.ADJUST_MS, self._adjust_job)
+
+    def _adjust(self) -> None:
+        self._adjust_queued = False
         if not self.running:
             return
         try:
@@ -144,7 +203,6 @@ class TaskbarWidget:
                     self._tb.show(self.hwnd)
         except Exception:
             pass
-        self.root.after(1000, self._adjust_job)
 
     # ── UI ──────────────────────────────────────────────────────────────────
 
@@ -152,77 +210,56 @@ class TaskbarWidget:
         self.root.configure(bg=self.TRANS_COLOR)
         self.root.geometry(f"{self.WIDGET_WIDTH}x{self.WIDGET_HEIGHT}")
 
-        # Place container statically so text width doesn't shift it
-        container = tk.Frame(self.root, bg=self.TRANS_COLOR)
-        container.place(relx=0.03, rely=0.5, anchor="w")
-
-        # Use original font for text
-        sys_font = ("Segoe UI Semibold", 10)
-
-        # Custom Canvas to draw exact DU Meter pixel arrows (fixed to the left)
-        icon_canvas = tk.Canvas(
-            container, width=16, height=36,
+        # One canvas holds the arrows and all four speed texts: an update is
+        # an itemconfigure on the changed text items, with no Label
+        # geometry pass
+        canvas = self._canvas = tk.Canvas(
+            self.root, width=self.WIDGET_WIDTH, height=self.WIDGET_HEIGHT,
             bg=self.TRANS_COLOR, highlightthickness=0
         )
-        icon_canvas.grid(row=0, column=0, rowspan=2, padx=(0, 6), pady=0)
-
-        # Download (Top) - Cyan arrow pointing DOWN to a line
-        # Draw the triangle head pointing down
-        icon_canvas.create_polygon(
-            2, 7, 14, 7,      # Top flat part of the triangle
-            8, 14,            # Pointing straight down
-            fill=self.DL_COLOR, width=0
-        )
-        # Draw the stem of the arrow
-        icon_canvas.create_rectangle(5, 2, 11, 8, fill=self.DL_COLOR, outline="")
-        # Draw the solid base line it points to
-        icon_canvas.create_rectangle(3, 16, 13, 17, fill=self.DL_COLOR, outline="")
-
-        # Upload (Bottom) - Orange arrow pointing UP from a line
-        # Draw the solid base line it starts from
-        icon_canvas.create_rectangle(3, 20, 13, 21, fill=self.UL_COLOR, outline="")
-        # Draw the triangle head pointing up
-        icon_canvas.create_polygon(
-            2, 30, 14, 30,    # Bottom flat part of the triangle
-            8, 23,            # Pointing straight up
-            fill=self.UL_COLOR, width=0
-        )
-        # Draw the stem of the arrow
-        icon_canvas.create_rectangle(5, 29, 11, 35, fill=self.UL_COLOR, outline="")
+        canvas.place(x=0, y=0)
+        self._canvas_path = str(canvas)
 
-        # Ensure columns don't collapse and assign appropriate weights
-        # Icon canvas, then right-aligned numbers, then left-aligned units
-        container.columnconfigure(0, weight=0)
-        container.columnconfigure(1, weight=0, minsize=40)
-        container.columnconfigure(2, weight=1)
+        # Use original font for text
+        sys_font = self._font = tkfont.Font(  # kept: named font lives with it
+            root=self.root, family="Segoe UI Semibold", size=10)
+        # Digits are tabular, so number widths follow from these two
+        self._digit_w = sys_font.measure("0")
+        self._dot_w = sys_font.measure(".")
+
+        # Both DU Meter pixel arrows live in one image (fixed to the left):
+        # a single canvas item instead of six shapes
+        w, h = _icons.ARROW_SIZE
+        self._arrows_img = tk.PhotoImage(master=self.root, width=w, height=h)
+        self._paint_arrows(self.DL_COLOR, self.UL_COLOR)
+        canvas.create_image(
+            self.ICON_X, (self.WIDGET_HEIGHT - h) // 2,
+            image=self._arrows_img, anchor="nw")
+
+        # Right-aligned numbers, then left-aligned units, one row each
+        # centered on half the line height above / below the middle
+        half_line = sys_font.metrics("linespace") // 2
+        dl_y = self.WIDGET_HEIGHT // 2 - half_line
+        ul_y = self.WIDGET_HEIGHT // 2 + half_line
+        self._num_col = self.NUM_MIN_W
+        num_x = self.TEXT_X + self._num_col
+        unit_x = num_x + 2
 
         # Download row text (Top)
-        self.dl_num = tk.Label(
-            container, text="0", font=sys_font,
-            fg=self.TEXT_COLOR, bg=self.TRANS_COLOR,
-            anchor="e", bd=0, pady=0
-        )
-        self.dl_num.grid(row=0, column=1, sticky="e", pady=(0, 0), padx=(0, 2))
-        self.dl_unit = tk.Label(
-            container, text="B/s", font=sys_font,
-            fg=self.TEXT_COLOR, bg=self.TRANS_COLOR,
-            anchor="w", bd=0, pady=0
-        )
-        self.dl_unit.grid(row=0, column=2, sticky="w", pady=(0, 0))
+        self._dl_num_id = canvas.create_text(
+            num_x, dl_y, text="0", font=sys_font, fill=self.TEXT_COLOR,
+            anchor="e", tags="num")
+        self._dl_unit_id = canvas.create_text(
+            unit_x, dl_y, text="B/s", font=sys_font, fill=self.TEXT_COLOR,
+            anchor="w", tags="unit")
 
         # Upload row text (Bottom)
-        self.ul_num = tk.Label(
-            container, text="0", font=sys_font,
-            fg=self.TEXT_COLOR, bg=self.TRANS_COLOR,
-            anchor="e", bd=0, pady=0
-        )
-        self.ul_num.grid(row=1, column=1, sticky="e", pady=(0, 0), padx=(0, 2))
-        self.ul_unit = tk.Label(
-            container, text="B/s", font=sys_font,
-            fg=self.TEXT_COLOR, bg=self.TRANS_COLOR,
-            anchor="w", bd=0, pady=0
-        )
-        self.ul_unit.grid(row=1, column=2, sticky="w", pady=(0, 0))
+        self._ul_num_id = canvas.create_text(
+            num_x, ul_y, text="0", font=sys_font, fill=self.TEXT_COLOR,
+            anchor="e", tags="num")
+        self._ul_unit_id = canvas.create_text(
+            unit_x, ul_y, text="B/s", font=sys_font, fill=self.TEXT_COLOR,
+            anchor="w", tags="unit")
 
         # Context menu
         self.menu = tk.Menu(
@@ -243,16 +280,26 @@ class TaskbarWidget:
         self.menu.add_separator()
         self.menu.add_command(label="Exit", command=self.exit_app)
 
-        for w in (container, self.ul_num, self.ul_unit, self.dl_num, self.dl_unit):
-            w.bind("<Button-3>", self._show_menu)
+        canvas.bind("<Button-3>", self._show_menu)
+
+    def set_colors(self, dl: str, ul: str) -> None:
+        """Recolor the arrow icons in place."""
+        self._paint_arrows(dl, ul)
+
+    def _paint_arrows(self, dl: str, ul: str) -> None:
+        img = self._arrows_img
+        img.blank()  # unpainted pixels stay transparent
+        for rect in _icons.DL_ARROW_RECTS:
+            img.put(dl, to=rect)
+        for rect in _icons.UL_ARROW_RECTS:
+            img.put(ul, to=rect)
 
     def _show_menu(self, e: tk.Event) -> None:
         self.menu.post(e.x_root, e.y_root)
 
     def _show_stats(self) -> None:
         try:
-            from presentation.windows.statistics_window import StatisticsWindow
-            StatisticsWindow(self.root, self._service, self._repo)
+            _lazy.statistics_window()(self.root, self._service, self._repo)
         except Exception as e:
             import traceback
             import sys
@@ -266,40 +313,89 @@ class TaskbarWidget:
             with open(log_path, "a", encoding="utf-8") as f:
                 f.write(f"Error opening statistics window:\n{traceback.format_exc()}\n")
 
-    # ── Speed callback ───────────────────────────────────────────────────────
+    # ── Speed updates ────────────────────────────────────────────────────────
 
-    @staticmethod
-    def _fmt(bps: int) -> tuple[str, str]:
-        if bps >= 1024 ** 3:
-            return f"{bps / 1024**3:.2f}", "GB/s"
-        if bps >= 1024 ** 2:
-            return f"{bps / 1024**2:.2f}", "MB/s"
-        if bps >= 1024:
-            return f"{bps / 1024:.2f}", "KB/s"
-        return f"{bps:.0f}", "B/s"
-
-    def _on_speed(self, snap: SpeedSnapshot) -> None:
-        try:
-            self.root.after(0, self._update_labels, snap)
-        except Exception:
-            pass
+    def _drain_pending(self) -> None:
+        if not self.running:
+            return
+        # Ctrl+C is checked here rather than on a timer of its own, so it
+        # costs the idle widget no extra wakeups
+        if _exit_requested.is_set():
+            self.exit_app()
+            return
+        # Nothing to draw while hidden behind a fullscreen app; the first
+        # drain after showing again picks up the current snapshot
+        if not self._hidden:
+            snap = self._service.latest_snapshot
+            if snap is not None and snap is not self._last_snap:
+                self._last_snap = snap
+                self._update_labels(snap)
+        self._after(self.DRAIN_MS, self._drain_pending)
 
     def _update_labels(self, snap: SpeedSnapshot) -> None:
-        try:
-            ul_n, ul_u = self._fmt(snap.up_speed)
-            dl_n, dl_u = self._fmt(snap.down_speed)
-            
-            self.ul_num.config(text=ul_n)
-            self.ul_unit.config(text=ul_u)
-            self.dl_num.config(text=dl_n)
-            self.dl_unit.config(text=dl_u)
-        except tk.TclError:
-            pass
+        # Only reached from the drain timer, which stops once self.running is
+        # cleared (exit or window destroyed), so no TclError guard is needed
+        call = self._tk_call
+        path = self._canvas_path
+        renumbered = False
+        ul = snap.up_speed
+        if ul != self._last_ul:
+            self._last_ul = ul
+            ul_n, ul_u = text = format_speed(ul)
+            old_n, old_u = self._ul_text
+            self._ul_text = text
+            if ul_n != old_n:
+                call(path, "itemconfigure", self._ul_num_id, "-text", ul_n)
+                renumbered = True
+            if ul_u != old_u:
+                call(path, "itemconfigure", self._ul_unit_id, "-text", ul_u)
+        dl = snap.down_speed
+        if dl != self._last_dl:
+            self._last_dl = dl
+            dl_n, dl_u = text = format_speed(dl)
+            old_n, old_u = self._dl_text
+            self._dl_text = text
+            if dl_n != old_n:
+                call(path, "itemconfigure", self._dl_num_id, "-text", dl_n)
+                renumbered = True
+            if dl_u != old_u:
+                call(path, "itemconfigure", self._dl_unit_id, "-text", dl_u)
+        if renumbered:
+            self._fit_number_column()
+
+    def _fit_number_column(self) -> None:
+        # Grow the number column for wide values (and shrink back), pushing
+        # the units right, like the old grid column with a minimum size
+        col = max(self.NUM_MIN_W,
+                  self._number_width(self._ul_text[0]),
+                  self._number_width(self._dl_text[0]))
+        dx = col - self._num_col
+        if dx:
+            self._num_col = col
+            self._canvas.move("num", dx, 0)
+            self._canvas.move("unit", dx, 0)
+
+    def _number_width(self, text: str) -> int:
+        dots = text.count(".")
+        return (len(text) - dots) * self._digit_w + dots * self._dot_w
 
     # ── System tray ─────────────────────────────────────────────────────────
 
     def _setup_tray(self) -> None:
         """Create a system tray icon with menu options."""
+        if self._tray_thread is not None:
+            return  # already running; a second icon would leak
+        # Icon decode and pystray setup happen on the tray thread, keeping
+        # them off the Tk startup path
+        self._tray_thread = threading.Thread(
+            target=self._run_tray, daemon=True, name="SpeedMonitor-Tray")
+        self._tray_thread.start()
+
+    def _run_tray(self) -> None:
+        # pystray (and PIL, which it pulls in) load here on the tray thread,
+        # off the path to the widget's first paint
+        import pystray
+
         icon_img = self._create_tray_icon()
         menu = pystray.Menu(
             pystray.MenuItem("Usage Statistics", self._tray_show_stats),
@@ -308,42 +404,26 @@ class TaskbarWidget:
         )
         self._tray_icon = pystray.Icon(
             "SpeedMonitor", icon_img, "SpeedMonitor", menu)
-        threading.Thread(target=self._tray_icon.run, daemon=True).start()
+        if self.running:
+            self._tray_icon.run()
 
     @staticmethod
     def _create_tray_icon() -> Image.Image:
-        """Generate a polished 64x64 tray icon."""
-        size = 64
-        img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-
-        # Rounded dark background
-        r = 12
-        draw.rounded_rectangle([0, 0, size - 1, size - 1], radius=r,
-                               fill="#1e1e1e")
+        """Decode the pre-rendered 64x64 tray icon."""
+        from PIL import Image
 
-        # Thin separator line
-        draw.line([(10, 31), (54, 31)], fill="#333333", width=1)
-
-        # Up arrow (orange) — top half
-        draw.polygon([(32, 6), (18, 26), (27, 26), (27, 29),
-                      (37, 29), (37, 26), (46, 26)], fill="#f39c12")
-
-        # Down arrow (cyan) — bottom half
-        draw.polygon([(32, 58), (18, 38), (27, 38), (27, 35),
-                      (37, 35), (37, 38), (46, 38)], fill="#00e5ff")
-
-        return img
+        return Image.open(io.BytesIO(base64.b64decode(_icons.TRAY_ICON_PNG_B64)))
 
     def _tray_show_stats(self, icon=None, item=None) -> None:
-        self.root.after(0, self._show_stats)
+        self._after(0, self._show_stats)
 
     def _tray_exit(self, icon=None, item=None) -> None:
-        self.root.after(0, self.exit_app)
+        self._after(0, self.exit_app)
 
     # ── Lifecycle ───────────────────────────────────────────────────────────
 
     def _cleanup(self) -> None:
+        self._tb.unregister_foreground_hook()
         self._service.stop()
         if self._tray_icon:
             try:
@@ -351,8 +431,15 @@ class TaskbarWidget:
             except Exception:
                 pass
 
+    def _on_destroy(self, e: tk.Event) -> None:
+        # The binding fires for every child too; react to the window itself
+        # (e.g. destroyed along with a master) so timers stop touching Tk
+        if e.widget is self.root:
+            self.running = False
+
     def exit_app(self) -> None:
         self.running = False
+        self._tb.unregister_foreground_hook()
         self._service.stop()
         if self._tray_icon:
             try:
@@ -0,0 +1,18 @@
+"""Shared CustomTkinter resources — Presentation layer.
+
+Fonts are created once per process and handed to every window that asks,
+instead of each window building its own named Tcl fonts on every open.
+Lives with the windows, not the widgets: it loads customtkinter.
+"""
+
+from __future__ import annotations
+
+import functools
+
+import customtkinter as ctk
+
+
+@functools.cache
+def get_ctk_font(size: int, bold: bool = False) -> ctk.CTkFont:
+    """Shared CTkFont per (size, weight), created on first use (needs a root)."""
+    return ctk.CTkFont(size=size, weight="bold" if bold else "normal")
@@ -7,6 +7,7 @@ network usage statistics for SpeedMonitor using CustomTkinter.
 from __future__ import annotations
 
 import csv
+import functools
 import tkinter as tk
 from datetime import date, timedelta
 from tkinter import filedialog, messagebox
@@ -14,10 +15,12 @@ from typing import TYPE_CHECKING
 
 import customtkinter as ctk
 
+from presentation.widgets._format import unit_index
+from presentation.windows._resources import get_ctk_font
 
 if TYPE_CHECKING:
     from application.services.speed_monitor_service import SpeedMonitorService
-    from domain.entities.network_usage import SpeedSnapshot
+    from domain.entities.network_usage import SpeedSnapshot, UsageOverview
     from domain.interfaces.usage_repository import UsageRepository
 
 # ── Theme Configuration ─────────────────────────────────────────────────
@@ -35,24 +38,82 @@ ACCENT_MAIN = "#7c6af7"   # purple — primary accent
 # ── Helpers ─────────────────────────────────────────────────────────────
 
 
+# Write buffer for CSV export: a year of rows is ~20 KB, so the whole file
+# goes out in one write
+_EXPORT_BUFFER = 1 << 16
+
+# How often the live-speed labels poll the service for a new sample
+_LIVE_UPDATE_MS = 250
+
+# Alpha steps for the open/close fades, one every _FADE_STEP_MS
+_FADE_STEP_MS = 16
+_FADE_IN_ALPHAS = tuple(min(1.0, 0.08 * i) for i in range(1, 14))
+_FADE_OUT_ALPHAS = tuple(max(0.0, 1.0 - 0.15 * i) for i in range(1, 8))
+
+# Keys of the Today tab's value labels (see _format_overview)
+_TODAY_KEYS = ("total", "up", "dn", "avg", "max_up", "max_dn", "time")
+
+# (reciprocal divisor, unit) indexed by how many factors of 1024 a value
+# spans; powers of two make the multiply exact
+_UNITS = ((1.0, "B"), (1 / 1024, "KB"),
+          (1 / 1024**2, "MB"), (1 / 1024**3, "GB"))
+
+
+@functools.lru_cache(maxsize=256)
 def _fmt_bytes(b: int | float) -> str:
-    if b >= 1024 ** 3:
-        return f"{b / 1024**3:.2f} GB"
-    if b >= 1024 ** 2:
-        return f"{b / 1024**2:.2f} MB"
-    if b >= 1024:
-        return f"{b / 1024:.2f} KB"
-    return f"{b:.0f} B"
+    i = unit_index(int(b))
+    if not i:
+        return f"{b:.0f} B"
+    scale, unit = _UNITS[i]
+    return f"{b * scale:.2f} {unit}"
 
 
 def _fmt_speed(bps: float) -> str:
-    if bps >= 1024 ** 3:
-        return f"{bps / 1024**3:.2f} GB/s"
-    if bps >= 1024 ** 2:
-        return f"{bps / 1024**2:.2f} MB/s"
-    if bps >= 1024:
-        return f"{bps / 1024:.2f} KB/s"
-    return f"{bps:.0f} B/s"
+    # Averages are floats that rarely repeat exactly; whole bytes per second
+    # are below display precision and give the cache a usable key
+    return _fmt_speed_whole(round(bps))
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt_speed_whole(bps: int) -> str:
+    i = unit_index(bps)
+    if not i:
+        return f"{bps:.0f} B/s"
+    scale, unit = _UNITS[i]
+    return f"{bps * scale:.2f} {unit}/s"
+
+
+def _format_overview(
+        overview: UsageOverview) -> tuple[dict[str, str], dict[str, str]]:
+    """Display strings for the Today and This Month tabs, keyed like their
+    label dicts — pure data, so the UI side is just a copy into labels."""
+    d = overview.daily
+    if d:
+        h = d.active_seconds // 3600
+        m = (d.active_seconds % 3600) // 60
+        s = d.active_seconds % 60
+        today_vals = {
+            "total": _fmt_bytes(d.total_bytes),
+            "up": _fmt_bytes(d.bytes_sent),
+            "dn": _fmt_bytes(d.bytes_recv),
+            "avg": _fmt_speed(d.avg_total_speed),
+            "max_up": _fmt_speed(d.max_up_speed),
+            "max_dn": _fmt_speed(d.max_down_speed),
+            "time": f"{h:02d}h {m:02d}m {s:02d}s",
+        }
+    else:
+        today_vals = dict.fromkeys(_TODAY_KEYS, "—")
+
+    m_ = overview.monthly
+    month_vals = {
+        "total": _fmt_bytes(m_.total_bytes),
+        "up": _fmt_bytes(m_.bytes_sent),
+        "dn": _fmt_bytes(m_.bytes_recv),
+        "peak_up": _fmt_speed(m_.max_up_speed),
+        "peak_dn": _fmt_speed(m_.max_down_speed),
+        "days": str(m_.days_tracked),
+    }
+    return today_vals, month_vals
 
 
 # ── Main Window ─────────────────────────────────────────────────────────
@@ -80,12 +141,24 @@ class StatisticsWindow:
         self._win.protocol("WM_DELETE_WINDOW", self._on_closing)
 
         self._auto_refresh_id: str | None = None
+        # Pending after() ids of the running fade, so a close mid-fade-in
+        # can cancel it
+        self._fade_ids: list[str] = []
+        # Value labels per tab, keyed like the dicts _refresh builds
+        self._today_labels: dict[str, ctk.CTkLabel] = {}
+        self._month_labels: dict[str, ctk.CTkLabel] = {}
+        # Text last shown per label, so unchanged values skip configure
+        self._shown: dict[ctk.CTkLabel, str] = {}
+        self._month_built = False
+        # Last month values from _refresh, applied when the tab is built
+        self._month_vals: dict[str, str] = {}
+        # Sample the live labels last showed, and the pending poll timer
+        self._live_snap: SpeedSnapshot | None = None
+        self._live_id: str | None = None
 
         self._build()
-        self._refresh()
-        self._schedule_auto_refresh()
-
-        self._service.subscribe(self._on_live_speed)
+        self._schedule_auto_refresh()  # runs the first refresh
+        self._poll_live()
 
         # Center on screen and reveal
         self._win.update_idletasks()
@@ -98,32 +171,56 @@ class StatisticsWindow:
         self._win.deiconify()
         self._fade_in()
 
+    def _fade(self, alphas: tuple[float, ...], done) -> None:
+        """Queue every alpha step of a fade up front, then *done*.
+
+        No step reads the alpha back, so a fade is one Tcl call per frame.
+        """
+        after = self._win.after
+        ids = [after(i * _FADE_STEP_MS, self._set_alpha, a)
+               for i, a in enumerate(alphas, 1)]
+        ids.append(after((len(alphas) + 1) * _FADE_STEP_MS, done))
+        self._fade_ids = ids
+
+    def _set_alpha(self, alpha: float) -> None:
+        try:
+            self._win.attributes("-alpha", alpha)
+        except tk.TclError:
+            pass  # window destroyed mid-fade
+
     def _fade_in(self) -> None:
-        alpha = self._win.attributes("-alpha")
-        if alpha < 1.0:
-            alpha += 0.08
-            self._win.attributes("-alpha", min(1.0, alpha))
-            self._win.after(16, self._fade_in)
-        else:
+        self._fade(_FADE_IN_ALPHAS, self._on_faded_in)
+
+    def _on_faded_in(self) -> None:
+        try:
             self._win.lift()
             self._win.focus_force()
+        except tk.TclError:
+            pass
 
     def _on_closing(self) -> None:
         if self._auto_refresh_id is not None:
             self._win.after_cancel(self._auto_refresh_id)
             self._auto_refresh_id = None
-        self._service.unsubscribe(self._on_live_speed)
+        if self._live_id is not None:
+            self._win.after_cancel(self._live_id)
+            self._live_id = None
         self._fade_out()
 
     def _fade_out(self) -> None:
         try:
-            alpha = self._win.attributes("-alpha")
-            if alpha > 0.0:
-                alpha -= 0.15
-                self._win.attributes("-alpha", max(0.0, alpha))
-                self._win.after(16, self._fade_out)
-            else:
-                self._win.destroy()
+            for job in self._fade_ids:
+                self._win.after_cancel(job)
+            # Closed mid-fade-in: continue down from the current alpha
+            alpha = float(self._win.attributes("-alpha"))
+        except tk.TclError:
+            return
+        self._fade(tuple(a for a in _FADE_OUT_ALPHAS if a < alpha),
+                   self._destroy)
+
+    def _destroy(self) -> None:
+        try:
+            self._win.destroy()
         except tk.TclError:
             pass
 
@@ -141,12 +238,12 @@ class StatisticsWindow:
 
         # Title
         title_lbl = ctk.CTkLabel(header, text="SpeedMonitor Statistics",
-                                 font=ctk.CTkFont(size=18, weight="bold"))
+                                 font=get_ctk_font(18, bold=True))
         title_lbl.pack(side=tk.LEFT, padx=(20, 10), pady=20)
 
         # Date
         date_lbl = ctk.CTkLabel(header, text=date.today().strftime(
-            "%B %d, %Y"), font=ctk.CTkFont(size=12), text_color="gray")
+            "%B %d, %Y"), font=get_ctk_font(12), text_color="gray")
         date_lbl.pack(side=tk.LEFT, padx=0)
 
         # Live Speed
@@ -155,29 +252,26 @@ class StatisticsWindow:
         self._lbl_live_up = ctk.CTkLabel(
             live_frame,
             text="↑ 0 B/s",
-            font=ctk.CTkFont(
-                size=13,
-                weight="bold"),
+            font=get_ctk_font(13, bold=True),
             text_color=ACCENT_UP)
         self._lbl_live_up.pack(side=tk.LEFT, padx=5)
         self._lbl_live_dn = ctk.CTkLabel(
             live_frame,
             text="↓ 0 B/s",
-            font=ctk.CTkFont(
-                size=13,
-                weight="bold"),
+            font=get_ctk_font(13, bold=True),
             text_color=ACCENT_DN)
         self._lbl_live_dn.pack(side=tk.LEFT, padx=5)
 
         # ── Tabview ─────────────────────────────────────────────────────────
-        self._tabview = ctk.CTkTabview(self._win, corner_radius=10)
+        self._tabview = ctk.CTkTabview(self._win, corner_radius=10,
+                                       command=self._on_tab_change)
         self._tabview.pack(fill=tk.BOTH, expand=True, padx=20, pady=(10, 5))
 
         self._tab_today = self._tabview.add("Today")
         self._tab_month = self._tabview.add("This Month")
 
+        # This Month is built the first time it is selected
         self._build_today_tab()
-        self._build_month_tab()
 
         # ── Footer ──────────────────────────────────────────────────────────
         footer = ctk.CTkFrame(
@@ -203,285 +297,154 @@ class StatisticsWindow:
                                   command=self._on_closing)
         btn_close.pack(side=tk.RIGHT, padx=20)
 
-    def _build_today_tab(self) -> None:
-        f = self._tab_today
-
-        # Hero Total
-        hero = ctk.CTkFrame(
-            f,
+    def _make_card(
+            self,
+            parent: ctk.CTkFrame,
+            title: str | None = None,
+            title_color: str = "gray",
+            title_font: ctk.CTkFont | None = None,
+            padx: int = 15,
+            pady: tuple[int, int] = (10, 5)) -> ctk.CTkFrame:
+        """Bordered card with an optional header label; the caller places it."""
+        card = ctk.CTkFrame(
+            parent,
             corner_radius=8,
             fg_color=BG_CARD,
             border_width=1,
             border_color="#333333")
+        if title is not None:
+            ctk.CTkLabel(
+                card,
+                text=title,
+                text_color=title_color,
+                font=title_font or get_ctk_font(11, bold=True)).pack(
+                anchor="w", padx=padx, pady=pady)
+        return card
+
+    def _card_value(
+            self,
+            card: ctk.CTkFrame,
+            font: ctk.CTkFont,
+            padx: int = 15,
+            pady: tuple[int, int] = (0, 15)) -> ctk.CTkLabel:
+        lbl = ctk.CTkLabel(card, text="—", font=font)
+        lbl.pack(anchor="w", padx=padx, pady=pady)
+        return lbl
+
+    def _build_totals(
+            self,
+            f: ctk.CTkFrame,
+            labels: dict[str, ctk.CTkLabel],
+            hero_title: str) -> None:
+        """Hero total plus the upload/download card pair, shared by both tabs."""
+        hero = self._make_card(f, hero_title, title_font=get_ctk_font(12),
+                               padx=20, pady=(15, 0))
         hero.pack(fill=tk.X, pady=(10, 10), padx=10)
-        ctk.CTkLabel(
-            hero,
-            text="Total Usage Today",
-            text_color="gray",
-            font=ctk.CTkFont(
-                size=12)).pack(
-            anchor="w",
-            padx=20,
-            pady=(
-                15,
-                0))
-        self._lbl_today_total = ctk.CTkLabel(
-            hero, text="—", font=ctk.CTkFont(
-                size=32, weight="bold"))
-        self._lbl_today_total.pack(anchor="w", padx=20, pady=(0, 15))
-
-        # Up/Down Row
+        labels["total"] = self._card_value(
+            hero, get_ctk_font(32, bold=True), padx=20)
+
         row = ctk.CTkFrame(f, fg_color="transparent")
         row.pack(fill=tk.X, pady=(0, 10), padx=10)
         row.columnconfigure(0, weight=1)
         row.columnconfigure(1, weight=1)
 
-        ul_card = ctk.CTkFrame(
-            row,
-            corner_radius=8,
-            fg_color=BG_CARD,
-            border_width=1,
-            border_color="#333333")
-        ul_card.grid(row=0, column=0, sticky="nsew", padx=(0, 5))
-        ctk.CTkLabel(
-            ul_card,
-            text="↑ UPLOAD",
-            text_color=ACCENT_UP,
-            font=ctk.CTkFont(
-                size=11,
-                weight="bold")).pack(
-            anchor="w",
-            padx=15,
-            pady=(
-                15,
-                0))
-        self._lbl_today_up = ctk.CTkLabel(
-            ul_card, text="—", font=ctk.CTkFont(
-                size=20, weight="bold"))
-        self._lbl_today_up.pack(anchor="w", padx=15, pady=(0, 15))
-
-        dn_card = ctk.CTkFrame(
-            row,
-            corner_radius=8,
-            fg_color=BG_CARD,
-            border_width=1,
-            border_color="#333333")
-        dn_card.grid(row=0, column=1, sticky="nsew", padx=(5, 0))
-        ctk.CTkLabel(
-            dn_card,
-            text="↓ DOWNLOAD",
-            text_color=ACCENT_DN,
-            font=ctk.CTkFont(
-                size=11,
-                weight="bold")).pack(
-            anchor="w",
-            padx=15,
-            pady=(
-                15,
-                0))
-        self._lbl_today_dn = ctk.CTkLabel(
-            dn_card, text="—", font=ctk.CTkFont(
-                size=20, weight="bold"))
-        self._lbl_today_dn.pack(anchor="w", padx=15, pady=(0, 15))
+        for col, key, title, color, padx in (
+                (0, "up", "↑ UPLOAD", ACCENT_UP, (0, 5)),
+                (1, "dn", "↓ DOWNLOAD", ACCENT_DN, (5, 0))):
+            card = self._make_card(row, title, title_color=color,
+                                   pady=(15, 0))
+            card.grid(row=0, column=col, sticky="nsew", padx=padx)
+            labels[key] = self._card_value(card, get_ctk_font(20, bold=True))
+
+    def _build_today_tab(self) -> None:
+        f = self._tab_today
+        self._build_totals(f, self._today_labels, "Total Usage Today")
 
         # Speed stats grid
-        speed_card = ctk.CTkFrame(
-            f,
-            corner_radius=8,
-            fg_color=BG_CARD,
-            border_width=1,
-            border_color="#333333")
+        speed_card = self._make_card(f, "SPEED METRICS")
         speed_card.pack(fill=tk.X, pady=(0, 10), padx=10)
-        ctk.CTkLabel(
-            speed_card,
-            text="SPEED METRICS",
-            text_color="gray",
-            font=ctk.CTkFont(
-                size=11,
-                weight="bold")).pack(
-            anchor="w",
-            padx=15,
-            pady=(
-                10,
-                5))
-
-        self._lbl_today_avg = self._stat_row(speed_card, "Avg Speed", 0)
-        self._lbl_today_max_up = self._stat_row(speed_card, "Peak ↑ Upload", 1)
-        self._lbl_today_max_dn = self._stat_row(
-            speed_card, "Peak ↓ Download", 2)
+        rows = self._stat_grid(speed_card)
+        for i, (key, label) in enumerate((("avg", "Avg Speed"),
+                                          ("max_up", "Peak ↑ Upload"),
+                                          ("max_dn", "Peak ↓ Download"))):
+            self._today_labels[key] = self._stat_row(rows, label, i)
 
         # Active time
-        time_card = ctk.CTkFrame(
-            f,
-            corner_radius=8,
-            fg_color=BG_CARD,
-            border_width=1,
-            border_color="#333333")
+        time_card = self._make_card(f, "MONITORING TIME", pady=(10, 0))
         time_card.pack(fill=tk.X, pady=(0, 10), padx=10)
-        ctk.CTkLabel(
-            time_card,
-            text="MONITORING TIME",
-            text_color="gray",
-            font=ctk.CTkFont(
-                size=11,
-                weight="bold")).pack(
-            anchor="w",
-            padx=15,
-            pady=(
-                10,
-                0))
-        self._lbl_today_time = ctk.CTkLabel(
-            time_card, text="—", font=ctk.CTkFont(size=14))
-        self._lbl_today_time.pack(anchor="w", padx=15, pady=(0, 10))
+        self._today_labels["time"] = self._card_value(
+            time_card, get_ctk_font(14), pady=(0, 10))
+
+    def _on_tab_change(self) -> None:
+        if not self._month_built and self._tabview.get() == "This Month":
+            self._month_built = True
+            self._build_month_tab()
+            self._show_values(self._month_labels, self._month_vals)
 
     def _build_month_tab(self) -> None:
         f = self._tab_month
+        self._build_totals(f, self._month_labels,
+                           f"Total — {date.today().strftime('%B %Y')}")
 
-        hero = ctk.CTkFrame(
-            f,
-            corner_radius=8,
-            fg_color=BG_CARD,
-            border_width=1,
-            border_color="#333333")
-        hero.pack(fill=tk.X, pady=(10, 10), padx=10)
-        ctk.CTkLabel(
-            hero,
-            text=f"Total — {date.today().strftime('%B %Y')}",
-            text_color="gray",
-            font=ctk.CTkFont(
-                size=12)).pack(
-            anchor="w",
-            padx=20,
-            pady=(
-                15,
-                0))
-        self._lbl_month_total = ctk.CTkLabel(
-            hero, text="—", font=ctk.CTkFont(
-                size=32, weight="bold"))
-        self._lbl_month_total.pack(anchor="w", padx=20, pady=(0, 15))
-
-        row = ctk.CTkFrame(f, fg_color="transparent")
-        row.pack(fill=tk.X, pady=(0, 10), padx=10)
-        row.columnconfigure(0, weight=1)
-        row.columnconfigure(1, weight=1)
-
-        ul_card = ctk.CTkFrame(
-            row,
-            corner_radius=8,
-            fg_color=BG_CARD,
-            border_width=1,
-            border_color="#333333")
-        ul_card.grid(row=0, column=0, sticky="nsew", padx=(0, 5))
-        ctk.CTkLabel(
-            ul_card,
-            text="↑ UPLOAD",
-            text_color=ACCENT_UP,
-            font=ctk.CTkFont(
-                size=11,
-                weight="bold")).pack(
-            anchor="w",
-            padx=15,
-            pady=(
-                15,
-                0))
-        self._lbl_month_up = ctk.CTkLabel(
-            ul_card, text="—", font=ctk.CTkFont(
-                size=20, weight="bold"))
-        self._lbl_month_up.pack(anchor="w", padx=15, pady=(0, 15))
-
-        dn_card = ctk.CTkFrame(
-            row,
-            corner_radius=8,
-            fg_color=BG_CARD,
-            border_width=1,
-            border_color="#333333")
-        dn_card.grid(row=0, column=1, sticky="nsew", padx=(5, 0))
-        ctk.CTkLabel(
-            dn_card,
-            text="↓ DOWNLOAD",
-            text_color=ACCENT_DN,
-            font=ctk.CTkFont(
-                size=11,
-                weight="bold")).pack(
-            anchor="w",
-            padx=15,
-            pady=(
-                15,
-                0))
-        self._lbl_month_dn = ctk.CTkLabel(
-            dn_card, text="—", font=ctk.CTkFont(
-                size=20, weight="bold"))
-        self._lbl_month_dn.pack(anchor="w", padx=15, pady=(0, 15))
-
-        peak_card = ctk.CTkFrame(
-            f,
-            corner_radius=8,
-            fg_color=BG_CARD,
-            border_width=1,
-            border_color="#333333")
+        peak_card = self._make_card(f, "PEAK SPEEDS")
         peak_card.pack(fill=tk.X, pady=(0, 10), padx=10)
-        ctk.CTkLabel(
-            peak_card,
-            text="PEAK SPEEDS",
-            text_color="gray",
-            font=ctk.CTkFont(
-                size=11,
-                weight="bold")).pack(
-            anchor="w",
-            padx=15,
-            pady=(
-                10,
-                5))
-        self._lbl_month_peak_up = self._stat_row(peak_card, "Peak ↑ Upload", 0)
-        self._lbl_month_peak_dn = self._stat_row(
-            peak_card, "Peak ↓ Download", 1)
-
-        days_card = ctk.CTkFrame(
-            f,
-            corner_radius=8,
-            fg_color=BG_CARD,
-            border_width=1,
-            border_color="#333333")
-        days_card.pack(fill=tk.X, pady=(0, 10), padx=10)
-        self._lbl_month_days = self._stat_row(days_card, "Days tracked", 0)
+        rows = self._stat_grid(peak_card)
+        self._month_labels["peak_up"] = self._stat_row(
+            rows, "Peak ↑ Upload", 0)
+        self._month_labels["peak_dn"] = self._stat_row(
+            rows, "Peak ↓ Download", 1)
 
+        days_card = self._make_card(f)
+        days_card.pack(fill=tk.X, pady=(0, 10), padx=10)
+        self._month_labels["days"] = self._stat_row(
+            self._stat_grid(days_card), "Days tracked", 0)
 
+    def _stat_grid(self, parent: ctk.CTkFrame) -> ctk.CTkFrame:
+        """Two-column grid for a card's stat rows: label left, value right."""
+        grid = ctk.CTkFrame(parent, fg_color="transparent")
+        grid.pack(fill=tk.X, padx=15)
+        grid.grid_columnconfigure(1, weight=1)
+        return grid
 
     def _stat_row(
             self,
             parent: ctk.CTkFrame,
             label: str,
             row: int) -> ctk.CTkLabel:
-        container = ctk.CTkFrame(parent, fg_color="transparent")
-        container.pack(fill=tk.X, padx=15, pady=(0, 5))
-
+        # Gridded straight into the card's _stat_grid: no per-row frame
         ctk.CTkLabel(
-            container,
+            parent,
             text=label,
             text_color="gray",
-            font=ctk.CTkFont(
-                size=13)).pack(
-            side=tk.LEFT)
+            font=get_ctk_font(13)).grid(
+            row=row, column=0, sticky="w", pady=(0, 5))
         val = ctk.CTkLabel(
-            container, text="—", font=ctk.CTkFont(
-                size=13, weight="bold"))
-        val.pack(side=tk.RIGHT)
+            parent, text="—", font=get_ctk_font(13, bold=True))
+        val.grid(row=row, column=1, sticky="e", pady=(0, 5))
 
         return val
 
     # ── Live Speed ──────────────────────────────────────────────────────────
 
-    def _on_live_speed(self, snap: SpeedSnapshot) -> None:
-        try:
-            self._win.after(0, self._update_live_labels, snap)
-        except Exception:
-            pass
+    def _poll_live(self) -> None:
+        # Polled on a Tk timer rather than subscribed: a subscriber runs on
+        # the sampler thread, and its after() call would block that thread
+        # until the Tk loop is free
+        snap = self._service.latest_snapshot
+        if snap is not None and snap is not self._live_snap:
+            self._live_snap = snap
+            self._update_live_labels(snap)
+        self._live_id = self._win.after(_LIVE_UPDATE_MS, self._poll_live)
 
     def _update_live_labels(self, snap: SpeedSnapshot) -> None:
+        shown = self._shown
         try:
-            self._lbl_live_up.configure(text=f"↑ {_fmt_speed(snap.up_speed)}")
-            self._lbl_live_dn.configure(
-                text=f"↓ {_fmt_speed(snap.down_speed)}")
+            for lbl, text in (
+                    (self._lbl_live_up, f"↑ {_fmt_speed(snap.up_speed)}"),
+                    (self._lbl_live_dn, f"↓ {_fmt_speed(snap.down_speed)}")):
+                if shown.get(lbl) != text:
+                    shown[lbl] = text
+                    lbl.configure(text=text)
         except Exception:
             pass
 
@@ -498,36 +461,23 @@ class StatisticsWindow:
             self._service.flush()
         except Exception:
             pass
-        today = date.today()
-
-        # Update Today
-        d = self._repo.get_daily(today)
-        if d:
-            self._lbl_today_total.configure(text=_fmt_bytes(d.total_bytes))
-            self._lbl_today_up.configure(text=_fmt_bytes(d.bytes_sent))
-            self._lbl_today_dn.configure(text=_fmt_bytes(d.bytes_recv))
-            self._lbl_today_avg.configure(text=_fmt_speed(d.avg_total_speed))
-            self._lbl_today_max_up.configure(text=_fmt_speed(d.max_up_speed))
-            self._lbl_today_max_dn.configure(text=_fmt_speed(d.max_down_speed))
-            h = d.active_seconds // 3600
-            m = (d.active_seconds % 3600) // 60
-            s = d.active_seconds % 60
-            self._lbl_today_time.configure(text=f"{h:02d}h {m:02d}m {s:02d}s")
-        else:
-            for lbl in (self._lbl_today_total, self._lbl_today_up,
-                        self._lbl_today_dn, self._lbl_today_avg,
-                        self._lbl_today_max_up, self._lbl_today_max_dn,
-                        self._lbl_today_time):
-                lbl.configure(text="—")
-
-        # Update Month
-        m_ = self._repo.get_monthly(today.year, today.month)
-        self._lbl_month_total.configure(text=_fmt_bytes(m_.total_bytes))
-        self._lbl_month_up.configure(text=_fmt_bytes(m_.bytes_sent))
-        self._lbl_month_dn.configure(text=_fmt_bytes(m_.bytes_recv))
-        self._lbl_month_peak_up.configure(text=_fmt_speed(m_.max_up_speed))
-        self._lbl_month_peak_dn.configure(text=_fmt_speed(m_.max_down_speed))
-        self._lbl_month_days.configure(text=str(m_.days_tracked))
+        # Today and this month in one repository read
+        overview = self._repo.get_overview(date.today())
+        today_vals, self._month_vals = _format_overview(overview)
+        self._show_values(self._today_labels, today_vals)
+        # Empty until the This Month tab is first opened
+        self._show_values(self._month_labels, self._month_vals)
+
+    def _show_values(
+            self,
+            labels: dict[str, ctk.CTkLabel],
+            vals: dict[str, str]) -> None:
+        shown = self._shown
+        for key, lbl in labels.items():
+            text = vals[key]
+            if shown.get(lbl) != text:
+                shown[lbl] = text
+                lbl.configure(text=text)
 
 
 
@@ -548,9 +498,10 @@ class StatisticsWindow:
         try:
             # Export all available data (e.g., last 365 days)
             start_date = date.today() - timedelta(days=365)
-            data = self._repo.get_range(start_date, date.today())
+            rows = self._repo.get_range_rows(start_date, date.today())
 
-            with open(file_path, mode='w', newline='', encoding='utf-8') as f:
+            with open(file_path, mode='w', newline='', encoding='utf-8',
+                      buffering=_EXPORT_BUFFER) as f:
                 writer = csv.writer(f)
                 writer.writerow(["Date",
                                  "Upload Bytes",
@@ -558,13 +509,8 @@ class StatisticsWindow:
                                  "Max Upload Speed (B/s)",
                                  "Max Download Speed (B/s)",
                                  "Active Seconds"])
-                for d in data:
-                    writer.writerow([d.day.isoformat(),
-                                     d.bytes_sent,
-                                     d.bytes_recv,
-                                     d.max_up_speed,
-                                     d.max_down_speed,
-                                     d.active_seconds])
+                # Rows already come in column order with ISO dates
+                writer.writerows(rows)
 
             messagebox.showinfo(
                 "Export Successful",